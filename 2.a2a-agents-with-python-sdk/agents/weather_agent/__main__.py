@@ -5,8 +5,11 @@ This server will handle HTTP requests, manage agent discovery, and coordinate th
 
 """
 
+import asyncio
 import os
 import sys
+from contextlib import asynccontextmanager
+
 import click
 import httpx
 from dotenv import load_dotenv
@@ -53,6 +56,27 @@ def build_agent_card(host: str, port: int) -> AgentCard:
     )
 
 
+def install_eager_task_factory(loop: asyncio.AbstractEventLoop) -> None:
+    """Install asyncio's eager task factory, reverting if the loop rejects it."""
+    # anyio (used by httpx and sse-starlette) only handles eager tasks from the
+    # stdlib factory, which in turn rejects the eager_start= uvloop 0.23 passes
+    loop.set_task_factory(asyncio.eager_task_factory)
+    probe = asyncio.sleep(0)
+    try:
+        loop.create_task(probe)
+    except TypeError:
+        probe.close()
+        loop.set_task_factory(None)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    """Enable eager task execution on the server's event loop at startup."""
+    # Most executor awaits (e.g. enqueue_event) finish without suspending
+    install_eager_task_factory(asyncio.get_running_loop())
+    yield
+
+
 @click.command()
 @click.option('--host', 'host', default='localhost', help='Host to bind the server to')
 @click.option('--port', 'port', default=10003, help='Port to bind the server to') 
@@ -100,7 +124,7 @@ def main(host: str, port: int):
     
     # Launch server with uvicorn
     import uvicorn
-    uvicorn.run(server.build(), host=host, port=port)
+    uvicorn.run(server.build(lifespan=lifespan), host=host, port=port)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -8,6 +8,8 @@ Every interaction flows through an event queue, enabling sophisticated features
 
 """
 
+import asyncio
+
 from a2a.server.events import EventQueue
 from a2a.server.agent_execution import RequestContext, AgentExecutor
 from a2a.types import TaskArtifactUpdateEvent, TaskStatusUpdateEvent, TaskStatus, TaskState
@@ -21,12 +23,24 @@ class WeatherAgentExecutor(AgentExecutor):
     Executor that bridges the A2A server infrastructure with the WeatherAgent.
     Handles task lifecycle management, event queue orchestration, and multi-turn conversation state.
     """
+
+    # Progress updates are buffered and flushed once either limit is reached.
+    # Limits are only checked when an event arrives, so a line that comes
+    # within the interval of the last flush waits for the next agent event
+    # (or the end of the stream), which can be seconds behind a slow LLM step.
+    PROGRESS_BATCH_SIZE = 8
+    PROGRESS_FLUSH_INTERVAL = 0.05  # seconds
+
+    # Yield to the loop after this many progress events or this much time
+    YIELD_EVERY = 16
+    YIELD_INTERVAL = 0.005  # seconds
     
     def __init__(self):
         self.agent = WeatherAgent()
 
     async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
         """Execute weather agent task with streaming updates."""
+        loop = asyncio.get_running_loop()
         query = context.get_user_input()
         task = context.current_task
         
@@ -38,69 +52,103 @@ class WeatherAgentExecutor(AgentExecutor):
             task = new_task(context.message)
             await event_queue.enqueue_event(task)
 
-        # Stream agent responses and convert to A2A events
-        async for event in self.agent.stream(query, task.context_id):
-            if event['is_task_complete']:
-                # Send final weather result artifact
+        # Task identity is fixed for the whole stream; events below are built
+        # with model_construct since every input is already a validated A2A type
+        tid, cid = task.id, task.context_id
+
+        # Bind module globals used per stream event to locals
+        status_update = TaskStatusUpdateEvent.model_construct
+        artifact_update = TaskArtifactUpdateEvent.model_construct
+        task_status = TaskStatus.model_construct
+        working_state = TaskState.working
+        completed_state = TaskState.completed
+        input_required_state = TaskState.input_required
+        agent_message = new_agent_text_message
+        text_artifact = new_text_artifact
+
+        pending_text: list[str] = []
+        last_flush = loop.time()
+        since_yield = 0
+        last_yield = last_flush
+
+        async def flush_progress() -> None:
+            # Send buffered progress updates as a single working-state event
+            nonlocal last_flush
+            if pending_text:
                 await event_queue.enqueue_event(
-                    TaskArtifactUpdateEvent(
-                        taskId=task.id,
-                        contextId=task.context_id,
-                        artifact=new_text_artifact(
-                            name='weather_report',
-                            description='Current weather information for the requested location.',
-                            text=event['content'],
+                    status_update(
+                        taskId=tid,
+                        contextId=cid,
+                        status=task_status(
+                            state=working_state,
+                            message=agent_message('\n'.join(pending_text), cid, tid),
                         ),
-                        append=False,
-                        lastChunk=True,
+                        final=False,
                     )
                 )
+                pending_text.clear()
+            last_flush = loop.time()
+
+        # Stream agent responses and convert to A2A events
+        async for event in self.agent.stream(query, cid):
+            if event['is_task_complete'] or event['require_user_input']:
+                # Keep progress ahead of the final events
+                await flush_progress()
+
+            if event['is_task_complete']:
+                # Final weather result artifact
+                artifact_event = artifact_update(
+                    taskId=tid,
+                    contextId=cid,
+                    artifact=text_artifact(
+                        name='weather_report',
+                        description='Current weather information for the requested location.',
+                        text=event['content'],
+                    ),
+                    append=False,
+                    lastChunk=True,
+                )
 
                 # Mark task as completed
-                await event_queue.enqueue_event(
-                    TaskStatusUpdateEvent(
-                        taskId=task.id,
-                        contextId=task.context_id,
-                        status=TaskStatus(state=TaskState.completed),
-                        final=True,
-                    )
+                status_event = status_update(
+                    taskId=tid,
+                    contextId=cid,
+                    status=task_status(state=completed_state),
+                    final=True,
                 )
+
+                await event_queue.enqueue_event(artifact_event)
+                await event_queue.enqueue_event(status_event)
             
             elif event['require_user_input']:
                 # Request additional input from user (e.g., location)
                 await event_queue.enqueue_event(
-                    TaskStatusUpdateEvent(
-                        taskId=task.id,
-                        contextId=task.context_id,
-                        status=TaskStatus(
-                            state=TaskState.input_required,
-                            message=new_agent_text_message(
-                                event['content'],
-                                task.context_id,
-                                task.id
-                            ),
+                    status_update(
+                        taskId=tid,
+                        contextId=cid,
+                        status=task_status(
+                            state=input_required_state,
+                            message=agent_message(event['content'], cid, tid),
                         ),
                         final=True,
                     )
                 )
             
             else:
-                # Send progress updates
-                await event_queue.enqueue_event(
-                    TaskStatusUpdateEvent(
-                        taskId=task.id,
-                        contextId=task.context_id,
-                        status=TaskStatus(
-                            state=TaskState.working,
-                            message=new_agent_text_message(
-                                event['content'],
-                                task.context_id,
-                                task.id
-                            ),
-                        ),
-                        final=False,
-                    )
-                )
+                # An in-process agent may never suspend, so let other tasks run
+                since_yield += 1
+                if since_yield >= self.YIELD_EVERY or loop.time() - last_yield > self.YIELD_INTERVAL:
+                    await asyncio.sleep(0)
+                    since_yield = 0
+                    last_yield = loop.time()
+
+                # Buffer progress updates
+                pending_text.append(event['content'])
+                if (len(pending_text) >= self.PROGRESS_BATCH_SIZE
+                        or loop.time() - last_flush > self.PROGRESS_FLUSH_INTERVAL):
+                    await flush_progress()
+
+        await flush_progress()
 
     async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
         """Cancel operation (not supported in this implementation)."""
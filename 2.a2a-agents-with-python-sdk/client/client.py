@@ -7,100 +7,169 @@ This client will handle the A2A protocol, manage streaming responses, and provid
 #!/usr/bin/env python3
 
 import asyncio
+import concurrent.futures
+import threading
+from contextlib import aclosing
 from uuid import uuid4
 
 import click
 import httpx
+import orjson
 from rich.console import Console
 
 from a2a.client import A2ACardResolver, ClientFactory, ClientConfig
 from a2a.types import Message, TextPart, Part, Role, TaskState
 
+# uvloop is unavailable on Windows; fall back to the stock asyncio loop there
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 console = Console()
 
+_ROLE_USER = Role.user
+_EXIT_CMDS = frozenset(('exit', 'quit', 'q'))
+_MAX_PREALLOC = 1 << 20  # bytes
+
 def build_message(text: str, task_id: str | None = None, context_id: str | None = None) -> Message:
     """Build message payload for A2A communication."""
-    return Message(
+    # Every field is a plain value we control, so skip Pydantic validation
+    return Message.model_construct(
         kind="message",
-        role=Role.user,
-        parts=[Part(root=TextPart(kind="text", text=text))],
+        role=_ROLE_USER,
+        parts=[Part.model_construct(root=TextPart.model_construct(kind="text", text=text))],
         message_id=uuid4().hex,
         task_id=task_id,
         context_id=context_id,
     )
 
-def extract_text_content(update) -> str | None:
-    """Extract text content from streaming updates."""
+def _install_eager_task_factory(loop: asyncio.AbstractEventLoop) -> None:
+    """Install asyncio's eager task factory, reverting if the loop rejects it."""
+    # anyio (used by httpx and sse-starlette) only handles eager tasks from the
+    # stdlib factory, which in turn rejects the eager_start= uvloop 0.23 passes
+    loop.set_task_factory(asyncio.eager_task_factory)
+    probe = asyncio.sleep(0)
     try:
-        if isinstance(update, tuple) and len(update) >= 2:
-            task, _ = update
-            if hasattr(task, 'artifacts') and task.artifacts:
-                for artifact in task.artifacts:
-                    if hasattr(artifact, 'parts') and artifact.parts:
-                        for part in artifact.parts:
-                            if hasattr(part, 'root') and hasattr(part.root, 'text'):
-                                return part.root.text
-        return None
-    except:
-        return None
+        loop.create_task(probe)
+    except TypeError:
+        probe.close()
+        loop.set_task_factory(None)
+
+async def _run_blocking(loop: asyncio.AbstractEventLoop, func, *args):
+    """Run a blocking call on a daemon thread so cancellation never waits on it."""
+    future = loop.create_future()
+
+    def resolve(result, exc):
+        if future.done():
+            return  # the awaiting task was cancelled
+        if exc is None:
+            future.set_result(result)
+        else:
+            future.set_exception(exc)
+
+    def worker():
+        try:
+            result, exc = func(*args), None
+        except Exception as e:
+            result, exc = None, e
+        try:
+            loop.call_soon_threadsafe(resolve, result, exc)
+        except RuntimeError:
+            pass  # loop already closed after Ctrl-C
+
+    # A pool thread stuck in input() would block executor shutdown on exit
+    threading.Thread(target=worker, name='a2a-input', daemon=True).start()
+    return await future
 
 # The client’s conversation handling showcases A2A’s support for complex interactions
 async def handle_conversation(client, text: str, task_id: str | None = None, context_id: str | None = None):
     """Handle streaming conversation with the weather agent."""
-    message = build_message(text, task_id, context_id)
-    
-    latest_task_id = None
-    latest_context_id = None
-    
-    console.print(f"[cyan]Processing: {text}[/cyan]")
-    
+    loop = asyncio.get_running_loop()
+
+    # Each input_required turn continues the loop instead of recursing
+    while True:
+        message = build_message(text, task_id, context_id)
         
-    try:
-        async for update in client.send_message(message):
-            # Extract task info for continuation
-            if isinstance(update, tuple):
-                task, _ = update
-                if task:
-                    if hasattr(task, "context_id"):
-                        latest_context_id = task.context_id
-                    if hasattr(task, "id"):
-                        latest_task_id = task.id
-                        
-                    # Handle task states
-                    if hasattr(task, "status") and hasattr(task.status, "state"):
-                        if task.status.state == TaskState.completed:
-                            # Show final weather report
-                            content = extract_text_content(update)
-                            if content:
-                                console.print(f"\n[green]{content}[/green]")
-                            return
-                        elif task.status.state == TaskState.input_required:
-                            # Show agent's request for more info
-                            if hasattr(task.status, "message") and hasattr(task.status.message, "parts"):
-                                for part in task.status.message.parts:
-                                    if hasattr(part, 'root') and hasattr(part.root, 'text'):
-                                        console.print(f"\n[yellow]{part.root.text}[/yellow]")
+        latest_task_id = None
+        latest_context_id = None
+        needs_reply = False
+        
+        console.print(f"[cyan]Processing: {text}[/cyan]")
+        
+            
+        try:
+            # aclosing() shuts the stream down as soon as we leave the loop
+            async with aclosing(client.send_message(message)) as stream:
+                async for update in stream:
+                    # Extract task info for continuation
+                    if isinstance(update, tuple):
+                        task, _ = update
+                        if task:
+                            latest_context_id = getattr(task, "context_id", latest_context_id)
+                            latest_task_id = getattr(task, "id", latest_task_id)
                             
-                            # Get user input and continue conversation
-                            follow_up = console.input("\n[bold cyan]Your reply: [/bold cyan]")
-                            await handle_conversation(client, follow_up, latest_task_id, latest_context_id)
-                            return
-    except asyncio.CancelledError:
-        # Handle graceful shutdown
-        pass
-    except Exception as e:
-        console.print(f"[red]Stream error: {e}[/red]")
+                            # Handle task states
+                            status = getattr(task, "status", None)
+                            state = getattr(status, "state", None)
+                            if state == TaskState.completed:
+                                # Show final weather report from the first text part
+                                for artifact in getattr(task, "artifacts", None) or ():
+                                    for part in getattr(artifact, "parts", None) or ():
+                                        content = getattr(getattr(part, 'root', None), 'text', None)
+                                        if content:
+                                            console.print(f"\n[green]{content}[/green]")
+                                            return
+                                return
+                            elif state == TaskState.input_required:
+                                # Show agent's request for more info
+                                status_message = getattr(status, "message", None)
+                                for part in getattr(status_message, "parts", None) or ():
+                                    prompt = getattr(getattr(part, 'root', None), 'text', None)
+                                    if prompt is not None:
+                                        console.print(f"\n[yellow]{prompt}[/yellow]")
+                                needs_reply = True
+                                break
+        except Exception as e:
+            console.print(f"[red]Stream error: {e}[/red]")
+            return
+
+        if not needs_reply:
+            return
+
+        # Get user input and continue conversation
+        follow_up = await _run_blocking(loop, console.input, "\n[bold cyan]Your reply: [/bold cyan]")
+        text, task_id, context_id = follow_up, latest_task_id, latest_context_id
     
 
-async def check_streaming_support(agent_url: str) -> bool:
+async def _read_body(response: httpx.Response) -> bytes | bytearray:
+    """Read a streamed response body, preallocating when its size is known."""
+    size = int(response.headers.get("content-length", 0))
+    # Never trust an oversized Content-Length for the upfront allocation
+    if not 0 < size <= _MAX_PREALLOC or "content-encoding" in response.headers:
+        return await response.aread()
+
+    # Fill a buffer of the advertised size instead of growing one chunk by chunk
+    buf = bytearray(size)
+    offset = 0
+    with memoryview(buf) as view:
+        async for chunk in response.aiter_raw():
+            view[offset:offset + len(chunk)] = chunk
+            offset += len(chunk)
+    del buf[offset:]
+    return buf
+
+async def check_streaming_support(http_client: httpx.AsyncClient, agent_url: str) -> bool:
     """Check if the agent supports streaming."""
     try:
-        async with httpx.AsyncClient() as http_client:
-            response = await http_client.get(f"{agent_url}/.well-known/agent-card.json")
+        url = f"{agent_url}/.well-known/agent-card.json"
+        async with http_client.stream("GET", url, headers={"Accept": "application/json"}) as response:
             if response.status_code == 200:
-                agent_info = response.json()
-                return agent_info.get("capabilities", {}).get("streaming", False)
-    except:
+                agent_info = orjson.loads(await _read_body(response))
+                capabilities = agent_info.get("capabilities") if isinstance(agent_info, dict) else None
+                if isinstance(capabilities, dict):
+                    return capabilities.get("streaming", False)
+    except (httpx.HTTPError, httpx.InvalidURL, ValueError):
         pass
     return False
 
@@ -109,12 +178,23 @@ async def main_async(agent_url: str):
     """Main async function for client interaction."""
     console.print(f"[green]Connecting to weather agent...[/green]")
 
+    loop = asyncio.get_running_loop()
+    # Console input has its own daemon thread, so the default executor only
+    # serves DNS lookups on the stock asyncio loop (uvloop resolves natively).
+    # The client talks to a single agent host, so one worker is enough.
+    loop.set_default_executor(
+        concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='a2a-dns')
+    )
+    # Stream updates are often already buffered, so run new tasks eagerly
+    _install_eager_task_factory(loop)
 
-    # Check capabilities
-    supports_streaming = await check_streaming_support(agent_url)
-    console.print(f"[green]Connected! Streaming: {supports_streaming}[/green]")
+    # One client keeps a single keep-alive pool for discovery and streaming
+    limits = httpx.Limits(max_keepalive_connections=100, max_connections=100, keepalive_expiry=30)
+    async with httpx.AsyncClient(limits=limits) as http_client:
 
-    async with httpx.AsyncClient() as http_client:
+        # Check capabilities
+        supports_streaming = await check_streaming_support(http_client, agent_url)
+        console.print(f"[green]Connected! Streaming: {supports_streaming}[/green]")
     
         try:
             # Initialize client
@@ -128,30 +208,28 @@ async def main_async(agent_url: str):
             console.print("\n[bold blue]Weather Agent Ready![/bold blue]")
             console.print("[dim]Ask about weather anywhere in the world. Type 'exit' to quit.[/dim]\n")
 
-            try:
-                while True:
-                    try:
-                        user_input = console.input("[bold green]Weather query: [/bold green]")
-                        
-                        if user_input.lower().strip() in ['exit', 'quit', 'q']:
-                            console.print("\n[yellow]Goodbye![/yellow]")
-                            break
-                        
-                        if not user_input.strip():
-                            console.print("[yellow]Please enter a weather query.[/yellow]")
-                            continue
-                        
-                        await handle_conversation(client, user_input)
-                        console.print()  # Add spacing
-                            
-                    except KeyboardInterrupt:
+            while True:
+                try:
+                    user_input = await _run_blocking(loop, console.input, "[bold green]Weather query: [/bold green]")
+                    
+                    if user_input.strip().lower() in _EXIT_CMDS:
                         console.print("\n[yellow]Goodbye![/yellow]")
                         break
-                    except Exception as e:
-                        console.print(f"[red]Error: {e}[/red]")
-            finally:
-                # Give time for async generators to cleanup
-                await asyncio.sleep(0.1)
+                    
+                    if not user_input.strip():
+                        console.print("[yellow]Please enter a weather query.[/yellow]")
+                        continue
+                    
+                    await handle_conversation(client, user_input)
+                    console.print()  # Add spacing
+                        
+                except asyncio.CancelledError:
+                    # Ctrl-C cancels the main task while a prompt or stream is waiting
+                    asyncio.current_task().uncancel()
+                    console.print("\n[yellow]Goodbye![/yellow]")
+                    break
+                except Exception as e:
+                    console.print(f"[red]Error: {e}[/red]")
                         
         except Exception as e:
             console.print(f"[red]Failed to initialize client: {e}[/red]")
@@ -163,7 +241,12 @@ async def main_async(agent_url: str):
 def main(agent_url: str):
     """A2A Client for weather information."""
     try:
-        asyncio.run(main_async(agent_url))
+        if uvloop is not None:
+            # Drive the client on uvloop for lower per-callback latency while streaming
+            with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+                runner.run(main_async(agent_url))
+        else:
+            asyncio.run(main_async(agent_url))
     except KeyboardInterrupt:
         # Suppress the traceback for clean exit
         console.print("\n[yellow]Client terminated[/yellow]")